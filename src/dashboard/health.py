@@ -1,7 +1,9 @@
 """
 Health check endpoint for production monitoring
 """
+import functools
 import json
+import time
 from datetime import datetime
 from pathlib import Path
 import sys
@@ -10,45 +12,68 @@ import sys
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.utils.config import APP_NAME, APP_VERSION, PORT, HOST
+from src.utils.config import (
+    APP_NAME,
+    APP_VERSION,
+    PORT,
+    HOST,
+    DATA_DIR,
+    MODELS_DIR,
+    LOGS_DIR,
+)
 from src.utils.logger import app_logger
 
+# Static fields that never change between probes
+_HEALTH_TEMPLATE = {
+    "status": "healthy",
+    "app_name": APP_NAME,
+    "version": APP_VERSION,
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _directory_checks(nonce: int) -> dict:
+    """
+    Check that critical directories exist, cached per 30s window
+
+    The nonce is the current 30-second bucket, so load-balancer probes
+    hitting this every second reuse one set of stat() calls.
+
+    Args:
+        nonce: Current time bucket used as the cache key
+
+    Returns:
+        Dictionary of directory check results
+    """
+    return {
+        "data_dir": "ok" if DATA_DIR.exists() else "missing",
+        "models_dir": "ok" if MODELS_DIR.exists() else "missing",
+        "logs_dir": "ok" if LOGS_DIR.exists() else "missing",
+    }
+
 
 def health_check():
     """
     Perform health check and return status
-    
+
     Returns:
         Dictionary with health status
     """
     try:
-        health_status = {
-            "status": "healthy",
-            "app_name": APP_NAME,
-            "version": APP_VERSION,
-            "timestamp": datetime.now().isoformat(),
-            "checks": {
-                "imports": "ok",
-                "config": "ok",
-                "logging": "ok"
-            }
+        checks = {
+            "imports": "ok",
+            "config": "ok",
+            "logging": "ok",
         }
-        
-        # Check if critical directories exist
-        from src.utils.config import DATA_DIR, MODELS_DIR, LOGS_DIR
-        
-        health_status["checks"]["data_dir"] = "ok" if DATA_DIR.exists() else "missing"
-        health_status["checks"]["models_dir"] = "ok" if MODELS_DIR.exists() else "missing"
-        health_status["checks"]["logs_dir"] = "ok" if LOGS_DIR.exists() else "missing"
-        
-        # Overall status
-        if all(v == "ok" for v in health_status["checks"].values()):
-            health_status["status"] = "healthy"
-        else:
-            health_status["status"] = "degraded"
-        
-        return health_status
-        
+        checks.update(_directory_checks(int(time.time()) // 30))
+
+        return dict(
+            _HEALTH_TEMPLATE,
+            status="healthy" if all(v == "ok" for v in checks.values()) else "degraded",
+            timestamp=datetime.now().isoformat(),
+            checks=checks,
+        )
+
     except Exception as e:
         app_logger.error(f"Health check failed: {str(e)}")
         return {
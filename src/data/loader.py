@@ -4,7 +4,7 @@ Data loading and preprocessing module
 import pandas as pd
 from pathlib import Path
 from typing import Optional
-from src.utils.config import DATA_DIR
+from src.utils.config import DATA_DIR, ensure_dirs
 from src.utils.logger import app_logger
 
 
@@ -12,54 +12,208 @@ class DataLoader:
     """Handle data loading and preprocessing"""
     
     def __init__(self, data_dir: Path = DATA_DIR):
+        ensure_dirs()
         self.data_dir = data_dir
         self.logger = app_logger
         
-    def load_csv(self, filename: str) -> Optional[pd.DataFrame]:
+    def _load_csv_head(
+        self,
+        file_path: Path,
+        nrows: int,
+        columns: Optional[list] = None,
+    ) -> pd.DataFrame:
+        """
+        Read only the first nrows of a CSV via incremental pyarrow batches
+
+        Pulls 1 MB blocks from the streaming reader and stops as soon as
+        the row limit is covered, so a row cap never pays for parsing the
+        whole file.
+
+        Args:
+            file_path: Path of CSV file
+            nrows: Maximum number of rows to read
+            columns: Optional subset of columns to load
+
+        Returns:
+            DataFrame with at most nrows rows
+        """
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+
+        convert_options = (
+            pa_csv.ConvertOptions(include_columns=columns) if columns else None
+        )
+        batches = []
+        remaining = nrows
+        with pa_csv.open_csv(
+            file_path,
+            read_options=pa_csv.ReadOptions(block_size=1 << 20),
+            convert_options=convert_options,
+        ) as reader:
+            for batch in reader:
+                batches.append(batch)
+                remaining -= batch.num_rows
+                if remaining <= 0:
+                    break
+        table = pa.Table.from_batches(batches, schema=reader.schema)
+        return table.slice(0, nrows).to_pandas()
+
+    def load_csv(
+        self,
+        filename: str,
+        columns: Optional[list] = None,
+        dtype: Optional[dict] = None,
+        nrows: Optional[int] = None,
+    ) -> Optional[pd.DataFrame]:
         """
         Load CSV file from data directory
-        
+
+        Uses the multithreaded pyarrow parser when available, falling back
+        to the default C engine. When columns is given, only those columns
+        are materialized, so memory is never allocated for unused ones.
+        A dtype mapping is applied during the parse, avoiding a second
+        astype copy afterwards. A row limit stops parsing early instead
+        of reading the whole file and truncating.
+
         Args:
             filename: Name of CSV file
-            
+            columns: Optional subset of columns to load
+            dtype: Optional column name -> dtype mapping
+            nrows: Optional maximum number of rows to read
+
         Returns:
             DataFrame or None if file not found
         """
         file_path = self.data_dir / filename
-        
+
         try:
             if file_path.exists():
-                df = pd.read_csv(file_path)
-                self.logger.info(f"Loaded {len(df)} records from {filename}")
+                try:
+                    if nrows is not None and dtype:
+                        # pandas' pyarrow engine rejects nrows, so the
+                        # row-capped dtype parse stays on the C engine
+                        df = pd.read_csv(
+                            file_path, usecols=columns, dtype=dtype, nrows=nrows
+                        )
+                    elif nrows is not None:
+                        df = self._load_csv_head(file_path, nrows, columns)
+                    elif dtype:
+                        df = pd.read_csv(
+                            file_path, engine="pyarrow", usecols=columns, dtype=dtype
+                        )
+                    elif columns:
+                        import pyarrow.csv as pa_csv
+
+                        df = pa_csv.read_csv(
+                            file_path,
+                            convert_options=pa_csv.ConvertOptions(include_columns=columns),
+                        ).to_pandas()
+                    else:
+                        df = pd.read_csv(file_path, engine="pyarrow")
+                except ImportError:
+                    df = pd.read_csv(
+                        file_path,
+                        cache_dates=True,
+                        low_memory=False,
+                        usecols=columns,
+                        dtype=dtype,
+                        nrows=nrows,
+                    )
+                self.logger.info("Loaded %d records from %s", len(df), filename)
                 return df
             else:
-                self.logger.warning(f"File not found: {file_path}")
+                self.logger.warning("File not found: %s", file_path)
                 return None
         except Exception as e:
-            self.logger.error(f"Error loading {filename}: {str(e)}")
+            self.logger.error("Error loading %s: %s", filename, e)
             return None
     
     def save_csv(self, df: pd.DataFrame, filename: str) -> bool:
         """
         Save DataFrame to CSV file
-        
+
+        Writes through pyarrow's C++ CSV writer when available (no index
+        column is written either way), falling back to pandas' writer.
+
         Args:
             df: DataFrame to save
             filename: Output filename
-            
+
         Returns:
             True if successful, False otherwise
         """
         file_path = self.data_dir / filename
-        
+
         try:
-            df.to_csv(file_path, index=False)
-            self.logger.info(f"Saved {len(df)} records to {filename}")
+            try:
+                import pyarrow as pa
+                import pyarrow.csv as pa_csv
+
+                pa_csv.write_csv(
+                    pa.Table.from_pandas(df, preserve_index=False), file_path
+                )
+            except ImportError:
+                df.to_csv(file_path, index=False)
+            self.logger.info("Saved %d records to %s", len(df), filename)
             return True
         except Exception as e:
-            self.logger.error(f"Error saving {filename}: {str(e)}")
+            self.logger.error("Error saving %s: %s", filename, e)
             return False
     
+    def load_feather(self, filename: str, columns: Optional[list] = None) -> Optional[pd.DataFrame]:
+        """
+        Load Feather (Arrow IPC) file from data directory
+
+        Preferred over CSV for data this app writes and rereads itself:
+        reads decompress in parallel and can project just the columns
+        needed.
+
+        Args:
+            filename: Name of Feather file
+            columns: Optional subset of columns to read
+
+        Returns:
+            DataFrame or None if file not found
+        """
+        file_path = self.data_dir / filename
+
+        try:
+            if file_path.exists():
+                import pyarrow.feather as feather
+
+                df = feather.read_table(file_path, columns=columns).to_pandas()
+                self.logger.info("Loaded %d records from %s", len(df), filename)
+                return df
+            else:
+                self.logger.warning("File not found: %s", file_path)
+                return None
+        except Exception as e:
+            self.logger.error("Error loading %s: %s", filename, e)
+            return None
+
+    def save_feather(self, df: pd.DataFrame, filename: str) -> bool:
+        """
+        Save DataFrame to Feather (Arrow IPC) file
+
+        Args:
+            df: DataFrame to save
+            filename: Output filename
+
+        Returns:
+            True if successful, False otherwise
+        """
+        file_path = self.data_dir / filename
+
+        try:
+            import pyarrow.feather as feather
+
+            feather.write_feather(df, file_path, compression="zstd")
+            self.logger.info("Saved %d records to %s", len(df), filename)
+            return True
+        except Exception as e:
+            self.logger.error("Error saving %s: %s", filename, e)
+            return False
+
     def validate_data(self, df: pd.DataFrame, required_columns: list) -> bool:
         """
         Validate that DataFrame has required columns
@@ -73,6 +227,6 @@ class DataLoader:
         """
         missing = set(required_columns) - set(df.columns)
         if missing:
-            self.logger.error(f"Missing required columns: {missing}")
+            self.logger.error("Missing required columns: %s", missing)
             return False
         return True
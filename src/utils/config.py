@@ -14,9 +14,19 @@ DATA_DIR = BASE_DIR / "data"
 MODELS_DIR = BASE_DIR / "models"
 LOGS_DIR = BASE_DIR / "logs"
 
-# Create directories if they don't exist
-for directory in [DATA_DIR, MODELS_DIR, LOGS_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
+
+def ensure_dirs() -> None:
+    """
+    Create the data, models and logs directories if they don't exist
+
+    Called lazily by the code that actually writes to these directories
+    (logger setup, data loading) rather than at import time, so merely
+    importing config stays syscall-free. The exists() fast path makes
+    repeated calls one stat per directory.
+    """
+    for directory in (DATA_DIR, MODELS_DIR, LOGS_DIR):
+        if not directory.exists():
+            directory.mkdir(parents=True, exist_ok=True)
 
 # Server configuration
 PORT = int(os.getenv("PORT", 8501))
@@ -3,53 +3,134 @@ Helper functions for the application
 """
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from datetime import datetime
+from src.utils.rng import RNG
+
+# Risk levels in ascending severity order. The ordered categorical dtype
+# lets sorts and comparisons on risk_level run on int8 codes.
+RISK_LEVELS = ("Minimal", "Low", "Medium", "High", "Critical")
+RISK_LEVEL_DTYPE = pd.CategoricalDtype(categories=RISK_LEVELS, ordered=True)
+
+# Score thresholds between consecutive risk levels
+_RISK_THRESHOLDS = np.array([0.3, 0.6, 0.8, 0.95])
+_RISK_THRESHOLDS_F32 = _RISK_THRESHOLDS.astype(np.float32)
+_RISK_LABELS = np.array(RISK_LEVELS, dtype=object)
+
+
+def _risk_score_scalar(compliance_score: float, incident_count: float, audit_failures: float) -> float:
+    """Scalar risk score kernel for the common all-factors-present case."""
+    return (
+        (1.0 - compliance_score)
+        + min(incident_count / 10.0, 1.0)
+        + min(audit_failures / 5.0, 1.0)
+    ) / 3.0
+
+
+# JIT-compile the kernel when numba is installed; the plain Python
+# version above is the fallback
+try:
+    from numba import njit
+
+    _risk_score_scalar = njit(cache=True, fastmath=True)(_risk_score_scalar)
+except ImportError:
+    pass
 
 
 def calculate_risk_score(data: Dict[str, Any]) -> float:
     """
     Calculate risk score based on input data
-    
+
     Args:
         data: Dictionary containing risk factors
-        
+
     Returns:
         Risk score between 0 and 1
     """
+    if "compliance_score" in data and "incident_count" in data and "audit_failures" in data:
+        return _risk_score_scalar(
+            data["compliance_score"], data["incident_count"], data["audit_failures"]
+        )
+
     # Simplified risk calculation
     factors = []
-    
+
     if "compliance_score" in data:
         factors.append(1 - data["compliance_score"])
     if "incident_count" in data:
         factors.append(min(data["incident_count"] / 10, 1.0))
     if "audit_failures" in data:
         factors.append(min(data["audit_failures"] / 5, 1.0))
-        
+
     return np.mean(factors) if factors else 0.0
 
 
+def calculate_risk_scores(df: pd.DataFrame) -> np.ndarray:
+    """
+    Calculate risk scores for a whole DataFrame in one vectorized pass
+
+    Applies the same formula as calculate_risk_score column-wise, so
+    scoring N rows costs a handful of NumPy ops instead of N Python calls.
+    Missing values count as absent factors for their row, mirroring how
+    the scalar version skips absent keys.
+
+    Args:
+        df: DataFrame with risk factor columns
+
+    Returns:
+        Array of risk scores between 0 and 1
+    """
+    factors = []
+
+    if "compliance_score" in df.columns:
+        factors.append(1 - df["compliance_score"].to_numpy(dtype=float))
+    if "incident_count" in df.columns:
+        factors.append(np.minimum(df["incident_count"].to_numpy(dtype=float) / 10, 1.0))
+    if "audit_failures" in df.columns:
+        factors.append(np.minimum(df["audit_failures"].to_numpy(dtype=float) / 5, 1.0))
+
+    if not factors:
+        return np.zeros(len(df))
+
+    # Mean over present factors only; rows with no factor values score 0.
+    # Built from nansum and a count rather than nanmean, which warns on
+    # all-NaN rows.
+    stacked = np.array(factors)
+    counts = np.count_nonzero(~np.isnan(stacked), axis=0)
+    sums = np.nansum(stacked, axis=0)
+    return np.divide(sums, counts, out=np.zeros_like(sums), where=counts > 0)
+
+
+def get_risk_levels(scores: np.ndarray) -> np.ndarray:
+    """
+    Get risk levels for an array of scores in one vectorized pass
+
+    A branchless np.digitize over a contiguous float32 buffer replaces
+    the per-score if/elif chain, so N scores map to labels in C-level
+    code. Scores are float32 throughout the pipeline, so the narrower
+    compare loses no precision in practice.
+
+    Args:
+        scores: Array of risk scores between 0 and 1
+
+    Returns:
+        Array of risk level strings
+    """
+    scores = np.ascontiguousarray(scores, dtype=np.float32)
+    return _RISK_LABELS[np.digitize(scores, _RISK_THRESHOLDS_F32, right=False)]
+
+
 def get_risk_level(score: float) -> str:
     """
     Get risk level based on score
-    
+
     Args:
         score: Risk score between 0 and 1
-        
+
     Returns:
         Risk level string
     """
-    if score >= 0.95:
-        return "Critical"
-    elif score >= 0.8:
-        return "High"
-    elif score >= 0.6:
-        return "Medium"
-    elif score >= 0.3:
-        return "Low"
-    else:
-        return "Minimal"
+    return _RISK_LABELS[np.searchsorted(_RISK_THRESHOLDS, score, side="right")]
 
 
 def format_timestamp(timestamp: datetime = None) -> str:
@@ -67,30 +148,36 @@ def format_timestamp(timestamp: datetime = None) -> str:
     return timestamp.strftime("%Y-%m-%d %H:%M:%S")
 
 
-def generate_sample_data(n_samples: int = 100) -> pd.DataFrame:
+def generate_sample_data(n_samples: int = 100, seed: Optional[int] = 42) -> pd.DataFrame:
     """
     Generate sample risk assessment data for demo
-    
+
     Args:
         n_samples: Number of samples to generate
-        
+        seed: Seed for reproducible output (None uses the shared RNG)
+
     Returns:
         DataFrame with sample data
     """
-    np.random.seed(42)
-    
+    rng = np.random.default_rng(seed) if seed is not None else RNG
+
     data = {
-        "entity_id": [f"ENT-{i:05d}" for i in range(n_samples)],
-        "compliance_score": np.random.uniform(0.5, 1.0, n_samples),
-        "incident_count": np.random.poisson(2, n_samples),
-        "audit_failures": np.random.poisson(1, n_samples),
+        # np.char.zfill rejects zero-size arrays, so guard the empty case
+        "entity_id": (
+            np.char.add("ENT-", np.char.zfill(np.arange(n_samples).astype(str), 5))
+            if n_samples
+            else np.array([], dtype=str)
+        ),
+        "compliance_score": rng.uniform(0.5, 1.0, n_samples).astype(np.float32),
+        "incident_count": rng.poisson(2, n_samples).astype(np.int16),
+        "audit_failures": rng.poisson(1, n_samples).astype(np.int16),
         "last_audit_date": pd.date_range(end=datetime.now(), periods=n_samples, freq="D"),
     }
     
     df = pd.DataFrame(data)
-    df["risk_score"] = df.apply(
-        lambda row: calculate_risk_score(row.to_dict()), axis=1
+    df["risk_score"] = calculate_risk_scores(df).astype(np.float32)
+    df["risk_level"] = pd.Categorical(
+        get_risk_levels(df["risk_score"].to_numpy()), dtype=RISK_LEVEL_DTYPE
     )
-    df["risk_level"] = df["risk_score"].apply(get_risk_level)
-    
+
     return df
@@ -1,45 +1,61 @@
 """
 Logging utility for production environment
 """
+import functools
 import logging
 import sys
+from logging.handlers import RotatingFileHandler
 from pathlib import Path
-from src.utils.config import LOG_LEVEL, LOG_FORMAT, LOGS_DIR
+from src.utils.config import LOG_LEVEL, LOG_FORMAT, LOGS_DIR, ensure_dirs
 
+# One formatter shared by all handlers
+_FORMATTER = logging.Formatter(LOG_FORMAT)
 
+# Bound log file growth in long-running processes
+_MAX_LOG_BYTES = 1024 * 1024
+_BACKUP_COUNT = 3
+
+
+@functools.lru_cache(maxsize=None)
 def setup_logger(name: str, log_file: str = None) -> logging.Logger:
     """
     Set up a logger with file and console handlers
-    
+
+    Memoized by (name, log_file) so repeated calls (e.g. under Streamlit
+    hot-reload) reuse the configured logger instead of stacking or
+    recreating handlers.
+
     Args:
         name: Logger name
         log_file: Optional log file name
-        
+
     Returns:
         Configured logger instance
     """
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, LOG_LEVEL))
-    
-    # Remove existing handlers
-    logger.handlers = []
-    
+
+    # Already configured (survives module reloads, which reset the cache)
+    if logger.hasHandlers():
+        return logger
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(getattr(logging, LOG_LEVEL))
-    console_formatter = logging.Formatter(LOG_FORMAT)
-    console_handler.setFormatter(console_formatter)
+    console_handler.setFormatter(_FORMATTER)
     logger.addHandler(console_handler)
-    
+
     # File handler (if log_file specified)
     if log_file:
+        ensure_dirs()
         log_path = LOGS_DIR / log_file
-        file_handler = logging.FileHandler(log_path)
+        file_handler = RotatingFileHandler(
+            log_path, maxBytes=_MAX_LOG_BYTES, backupCount=_BACKUP_COUNT
+        )
         file_handler.setLevel(getattr(logging, LOG_LEVEL))
-        file_formatter = logging.Formatter(LOG_FORMAT)
-        file_handler.setFormatter(file_formatter)
+        file_handler.setFormatter(_FORMATTER)
         logger.addHandler(file_handler)
-    
+
     return logger
 
 
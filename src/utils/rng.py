@@ -0,0 +1,11 @@
+"""
+Shared random number generator for the application
+"""
+import os
+import numpy as np
+
+# Single PCG64 generator shared by all non-deterministic generation.
+# Set APP_SEED in the environment to make runs reproducible (useful for
+# benchmarks and tests); leave it unset for fresh entropy per process.
+_seed = os.getenv("APP_SEED")
+RNG = np.random.default_rng(int(_seed) if _seed else None)